@@ -6,6 +6,7 @@ laeq_folder.py ― Compute sequential L(A/C)eq values from 1-second records
 Usage
 -----
     python laeq_folder.py path/to/your_folder [--include-short-periods] [--csv]
+                          [--glob PATTERN] [--no-cache] [--clear-cache]
 
 Arguments:
   path/to/your_folder       : Input folder with 1s dBA/dBC sample files.
@@ -13,6 +14,16 @@ Arguments:
                               than 15 minutes. Otherwise, only full 15-min
                               periods are output.
   --csv                     : Emit one CSV line per period.
+  --glob PATTERN            : Only read files in the folder matching PATTERN
+                              (default: all files). Files without the
+                              logger header are skipped either way.
+  --no-cache                : Recompute every file instead of reusing cached
+                              results.
+  --clear-cache             : Delete all cached results before running.
+
+Per-file results are cached under $XDG_CACHE_HOME/laeq (default
+~/.cache/laeq), keyed by the file's path, size and modification time, so
+only new or changed files are re-parsed on later runs.
 
 
 Data format expected per file
@@ -29,126 +40,474 @@ Example:
 
     25-05-2025,20:20:34, 52.30, dBA
     31-05-2025,15:45:49, 81.10, dBC
+
+If Numba is installed (`pip install .[fast]`) the Leq reduction is
+JIT-compiled; otherwise an equivalent NumPy implementation is used.
 """
 
 import argparse
+import codecs
+import contextlib
 import csv as csv_parser # Renamed to avoid conflict with args.csv
+import hashlib
+import io
 import math
+import mmap
+import os
 import sys
-from datetime import datetime, timedelta
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, fields, replace
+from functools import partial
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional
+    njit = None
+
 SECONDS_PER_BLOCK = 15 * 60  # 900 s → “Leq15”
+NS_PER_SECOND = 1_000_000_000
+BLOCK_NS = SECONDS_PER_BLOCK * NS_PER_SECOND
+LN10_OVER_10 = math.log(10) / 10  # 10 ** (L / 10) == exp(L * LN10_OVER_10)
+OUTPUT_CHUNK_LINES = 1024  # Rows buffered per write to stdout
+PREFETCH_THREADS = 4  # Threads issuing read-ahead hints for input files
+HEADER_PREFIX = b"STANDARD"  # Start of the logger's header line
+# Columns of a logger data line
+_COLUMNS = ["date", "time", "level", "unit"]
 # Updated FIELDNAMES for CSV output
 FIELDNAMES = ["start", "end", "seconds", "Leq_value", "unit"]
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "laeq"
+CACHE_VERSION = 6  # Bump whenever the cached result columns change
+
+
+def _empty_samples():
+    return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64), None
+
+
+def _ns_to_datetimes(ns):
+    """Convert an int64 array of nanosecond timestamps to a list of naive datetimes."""
+    return ns.astype("datetime64[ns]").astype("datetime64[us]").tolist()
+
+
+_READ_OPTIONS = dict(header=None, names=_COLUMNS, usecols=_COLUMNS, keep_default_na=False,
+                     skip_blank_lines=False, skipinitialspace=True, engine="c", encoding="utf-8")
+
+
+def _read_rows(source):
+    """
+    Tokenize logger data lines from `source` into a DataFrame with str date,
+    time and unit columns and a float64 level column, parsed by the C
+    tokenizer. Returns (df, levels, level_missing): the levels as a float64
+    array (NaN where not a number) and a mask of rows with an empty level
+    field. Only a file with a non-numeric level is re-read with the level as
+    str, which is then kept in df for warnings.
+    """
+    start = source.tell()
+    try:
+        df = pd.read_csv(source, dtype={"date": str, "time": str, "level": np.float64, "unit": str},
+                         na_values={"level": [""]}, **_READ_OPTIONS)
+        levels = df["level"].to_numpy()
+        return df, levels, np.isnan(levels)
+    except pd.errors.EmptyDataError:
+        return pd.DataFrame(columns=_COLUMNS, dtype=str), np.empty(0), np.zeros(0, dtype=bool)
+    except ValueError:  # A level that is not a number
+        source.seek(start)
+    df = pd.read_csv(source, dtype=str, **_READ_OPTIONS)
+    levels = pd.to_numeric(df["level"].str.strip(), errors="coerce").to_numpy(dtype=np.float64)
+    return df, levels, (df["level"] == "").to_numpy()
+
+
+def _digits(chars, positions):
+    """Return the ASCII digits at `positions` of each row as uint8 values (> 9 if not a digit)."""
+    return chars[:, positions] - np.uint8(ord("0"))
+
+
+def _timestamps_ns(dates, times):
+    """
+    Convert 'DD-MM-YYYY' dates and 'HH:MM:SS' times to int64 nanoseconds.
+    Fields in that exact fixed-width layout are converted with vectorized
+    integer arithmetic on their bytes; the rest go through pd.to_datetime.
+    Returns (ts_ns, bad), where bad marks rows that are not a valid timestamp,
+    including those outside the int64 nanosecond range (about 1677-2262).
+    """
+    n = len(dates)
+    try:
+        # One spare byte per field: it is non-zero for anything too long.
+        d = dates.to_numpy(dtype="S11").view(np.uint8).reshape(n, 11)
+        t = times.to_numpy(dtype="S9").view(np.uint8).reshape(n, 9)
+    except UnicodeEncodeError:
+        d, t = np.zeros((n, 11), dtype=np.uint8), np.zeros((n, 9), dtype=np.uint8)
+
+    dd = _digits(d, [0, 1, 3, 4, 6, 7, 8, 9])
+    tt = _digits(t, [0, 1, 3, 4, 6, 7])
+    fixed = ((dd <= 9).all(axis=1) & (tt <= 9).all(axis=1)
+             & (d[:, 2] == ord("-")) & (d[:, 5] == ord("-")) & (d[:, 10] == 0)
+             & (t[:, 2] == ord(":")) & (t[:, 5] == ord(":")) & (t[:, 8] == 0))
+    dd, tt = dd.astype(np.int64), tt.astype(np.int64)
+    day = dd[:, 0] * 10 + dd[:, 1]
+    month = dd[:, 2] * 10 + dd[:, 3]
+    year = dd[:, 4] * 1000 + dd[:, 5] * 100 + dd[:, 6] * 10 + dd[:, 7]
+    hour, minute, second = (tt[:, 0] * 10 + tt[:, 1], tt[:, 2] * 10 + tt[:, 3],
+                            tt[:, 4] * 10 + tt[:, 5])
+
+    month_start = ((year - 1970) * 12 + np.clip(month, 1, 12) - 1).astype("datetime64[M]")
+    first_day = month_start.astype("datetime64[D]")
+    days_in_month = ((month_start + 1).astype("datetime64[D]") - first_day).astype(np.int64)
+    # Whole years inside the nanosecond range; the partial ones at either end
+    # are checked exactly on the slow path.
+    fast = (fixed & (year > pd.Timestamp.min.year) & (year < pd.Timestamp.max.year)
+            & (month >= 1) & (month <= 12) & (day >= 1) & (day <= days_in_month)
+            & (hour < 24) & (minute < 60) & (second < 60))
+    seconds = ((first_day.astype(np.int64) + day - 1) * 24 + hour) * 3600 + minute * 60 + second
+    ts_ns = seconds * NS_PER_SECOND
+
+    bad = np.zeros(n, dtype=bool)
+    slow = np.flatnonzero(~fast)
+    if slow.size:
+        slow_times = times.iloc[slow].str.strip()
+        ts = pd.to_datetime(dates.iloc[slow].str.strip() + "," + slow_times,
+                            format="%d-%m-%Y,%H:%M:%S", errors="coerce")
+        # Out-of-range values would wrap around when cast to nanoseconds, and
+        # to_datetime rolls seconds 60 and 61 over into the next minute.
+        ok = (ts.between(pd.Timestamp.min, pd.Timestamp.max).to_numpy()
+              & slow_times.str.fullmatch(r".*:[0-5]?\d").to_numpy(dtype=bool))
+        bad[slow] = ~ok
+        ts_ns[slow[ok]] = ts.to_numpy()[ok].astype("datetime64[ns]").astype(np.int64)
+    return ts_ns, bad
 
 
 def parse_file_samples(path: Path):
     """
-    Yields (datetime, float level, str unit) samples from a single file.
+    Parse a single file into (ts_ns, levels, unit): an int64 array of
+    timestamps in nanoseconds, a float64 array of levels and the file's unit
+    (None if it has no valid samples).
+    The file is memory-mapped and tokenized in one pass by the pandas C parser.
     The 'unit' (e.g., "dBA", "dBC") is determined from the first valid data line
     and is expected to be consistent throughout the file.
     Rows with mismatching units or malformed data are skipped with a warning.
+    Files that do not start with the logger header are skipped after reading
+    only their first line.
     """
-    file_specific_unit = None
     try:
-        with path.open(newline="", encoding="utf-8") as fp:
-            reader = csv_parser.reader(fp)
-            header_seen = False
-            for line_num, row in enumerate(reader, 1):
-                if not header_seen and row and "STANDARD" in row[0]:
-                    header_seen = True
-                    continue
-
-                if len(row) < 4:  # Expect Date, Time, Level, Unit
-                    if any(s.strip() for s in row): # Report if not a completely blank line
-                        print(f"Warning: Skipping malformed/short row {line_num} in {path.name}: {row}", file=sys.stderr)
-                    continue
-                
-                date_str, time_str, level_str, current_row_unit = [s.strip() for s in row[:4]]
-
-                try:
-                    ts = datetime.strptime(f"{date_str},{time_str}", "%d-%m-%Y,%H:%M:%S")
-                    level = float(level_str)
-                    
-                    if file_specific_unit is None:
-                        file_specific_unit = current_row_unit
-                    elif file_specific_unit != current_row_unit:
-                        print(f"Warning: Unit mismatch in {path.name} at line {line_num}. Expected {file_specific_unit}, got {current_row_unit}. Skipping row.", file=sys.stderr)
-                        continue
-                    
-                    yield ts, level, file_specific_unit
-                
-                except ValueError:
-                    print(f"Warning: Skipping invalid data in row {line_num} in {path.name}: {row}", file=sys.stderr)
-                    continue
-        
-        if file_specific_unit is None and header_seen:
-             print(f"Warning: No valid data lines found after header in {path.name}. File processed, but no samples yielded.", file=sys.stderr)
-        elif not header_seen and file_specific_unit is None:
-             print(f"Warning: No header or valid data lines found in {path.name}. File could not be processed.", file=sys.stderr)
-
+        with path.open("rb") as fp:
+            if not fp.readline().removeprefix(codecs.BOM_UTF8).startswith(HEADER_PREFIX):
+                print(f"Warning: No logger header found in {path.name}. Skipping file.", file=sys.stderr)
+                return _empty_samples()
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                mm.readline()  # The header checked above
+                df, levels, level_missing = _read_rows(mm)
     except FileNotFoundError:
         print(f"Error: File not found {path}", file=sys.stderr)
+        return _empty_samples()
     except Exception as e:
         print(f"Error processing file {path.name}: {e}", file=sys.stderr)
+        return _empty_samples()
+
+    # skipinitialspace already drops leading blanks, so a missing field is "".
+    missing = np.column_stack([(df["date"] == "").to_numpy(), (df["time"] == "").to_numpy(),
+                               level_missing, (df["unit"] == "").to_numpy()])
+    blank = missing.all(axis=1)
+    short = missing.any(axis=1) & ~blank  # Expect Date, Time, Level, Unit
+
+    ts_ns, bad_ts = _timestamps_ns(df["date"], df["time"])
+    invalid = ~short & ~blank & (bad_ts | np.isnan(levels))
+
+    # Units take few distinct values, so strip each distinct value only once.
+    unit_codes, unit_values = pd.factorize(df["unit"])
+    units = np.array([u.strip() for u in unit_values] + [""], dtype=object)[unit_codes]
+    valid = ~(blank | short | invalid)
+    file_specific_unit = units[valid][0] if valid.any() else None
+    mismatch = valid & (units != file_specific_unit)
+
+    first_line_num = 2  # Line 1 is the header
+    for i in np.flatnonzero(short | invalid | mismatch):
+        line_num = i + first_line_num
+        row = [str(v) for v in df.iloc[i].tolist() if v != "" and v == v]  # v == v drops a NaN level
+        if short[i]:
+            print(f"Warning: Skipping malformed/short row {line_num} in {path.name}: {row}", file=sys.stderr)
+        elif invalid[i]:
+            print(f"Warning: Skipping invalid data in row {line_num} in {path.name}: {row}", file=sys.stderr)
+        else:
+            print(f"Warning: Unit mismatch in {path.name} at line {line_num}. Expected {file_specific_unit}, got {units[i]}. Skipping row.", file=sys.stderr)
+
+    if file_specific_unit is None:
+        print(f"Warning: No valid data lines found after header in {path.name}. File processed, but no samples yielded.", file=sys.stderr)
+        return _empty_samples()
+
+    keep = valid & ~mismatch
+    ts_ns, levels = ts_ns[keep], levels[keep]
+    if np.any(ts_ns[1:] < ts_ns[:-1]):
+        print(f"Warning: Timestamps out of order in {path.name}. Sorting samples.", file=sys.stderr)
+        order = np.argsort(ts_ns, kind="stable")
+        ts_ns, levels = ts_ns[order], levels[order]
+    return ts_ns, levels, file_specific_unit
 
 
-def groups_of_seconds(samples):
+def groups_of_seconds(ts_ns):
     """
-    Split the stream of (ts, level, unit) samples into sequential blocks of
-    SECONDS_PER_BLOCK seconds. The very first timestamp defines time zero for
-    the first block from that sample stream. Yields (start_dt, end_dt, levels_list, block_unit).
+    Split the sorted int64 nanosecond timestamps of one file into sequential
+    blocks of SECONDS_PER_BLOCK seconds. The very first timestamp defines time
+    zero for the first block; blocks with no samples are dropped.
+    Returns (starts_ns, ends_ns, bounds): block i starts at starts_ns[i], ends
+    at ends_ns[i] and holds samples bounds[i]:bounds[i + 1].
     """
-    current_start_dt, levels, current_block_unit = None, [], None
-    first_sample_in_stream = True
-
-    for ts, lvl, sample_unit in samples:
-        if first_sample_in_stream:
-            current_start_dt = ts
-            block_end_dt = current_start_dt + timedelta(seconds=SECONDS_PER_BLOCK)
-            current_block_unit = sample_unit
-            first_sample_in_stream = False
-
-        while ts >= block_end_dt:
-            if levels:
-                yield current_start_dt, block_end_dt, levels, current_block_unit
-            current_start_dt = block_end_dt
-            block_end_dt = current_start_dt + timedelta(seconds=SECONDS_PER_BLOCK)
-            levels = []
-        levels.append(lvl)
-    
-    if levels and current_start_dt is not None:
-        actual_end_dt = current_start_dt + timedelta(seconds=len(levels))
-        yield current_start_dt, actual_end_dt, levels, current_block_unit
+    if ts_ns.size == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, np.zeros(1, dtype=np.int64)
+
+    edges = np.arange(ts_ns[0], ts_ns[-1] + BLOCK_NS + 1, BLOCK_NS, dtype=np.int64)
+    idx = np.searchsorted(ts_ns, edges)
+    nonempty = idx[1:] > idx[:-1]
+    # Empty blocks hold no samples, so the non-empty ones stay contiguous.
+    bounds = np.append(idx[:-1][nonempty], idx[-1])
+    starts_ns = edges[:-1][nonempty]
+    ends_ns = edges[1:][nonempty]
+    # The final block ends after the samples it actually holds.
+    ends_ns[-1] = starts_ns[-1] + (bounds[-1] - bounds[-2]) * NS_PER_SECOND
+    return starts_ns, ends_ns, bounds
+
+
+# Fast-math flags that let the reduction be reordered (and vectorized) while
+# keeping IEEE inf/nan semantics, which the -inf handling below relies on.
+_FASTMATH = {"nsz", "arcp", "contract", "reassoc"}
+
+if njit is not None:
+    @njit(cache=True, fastmath=_FASTMATH)
+    def _leq_kernel(arr):
+        """Leq of a float64 array in a single fused pass."""
+        n = arr.shape[0]
+        if n == 0:
+            return np.nan
+        linear_sum = 0.0
+        for i in range(n):
+            linear_sum += math.exp(arr[i] * LN10_OVER_10)
+        if linear_sum == 0.0:
+            for i in range(n):
+                if arr[i] == -np.inf:
+                    return -np.inf
+            return np.nan
+        return 10.0 * math.log10(linear_sum / n)
+
+    @njit(cache=True, fastmath=_FASTMATH)
+    def _leq_full_block(arr):
+        """
+        _leq_kernel specialized for exactly SECONDS_PER_BLOCK samples; the
+        compile-time trip count lets LLVM unroll and vectorize the sum.
+        """
+        linear_sum = 0.0
+        for i in range(SECONDS_PER_BLOCK):
+            linear_sum += math.exp(arr[i] * LN10_OVER_10)
+        if linear_sum == 0.0:  # -inf levels or underflow: use the general kernel
+            return _leq_kernel(arr)
+        return 10.0 * math.log10(linear_sum / SECONDS_PER_BLOCK)
+
+    @njit(cache=True)
+    def _block_reduce(levels, firsts, lasts):
+        """
+        Return the Leq of every block of `levels`, where block i spans
+        levels[firsts[i]:lasts[i]].
+        """
+        out = np.empty(firsts.shape[0])
+        for i in range(out.shape[0]):
+            block = levels[firsts[i]:lasts[i]]
+            if block.shape[0] == SECONDS_PER_BLOCK:
+                out[i] = _leq_full_block(block)
+            else:
+                out[i] = _leq_kernel(block)
+        return out
+
+    # Compile (or load from cache) now rather than on the first block.
+    _block_reduce(np.zeros(1), np.array([0], dtype=np.int64), np.array([1], dtype=np.int64))
+else:
+    def _leq_kernel(arr):
+        """Leq of a float64 array (NumPy fallback)."""
+        if arr.size == 0:
+            return float("nan")
+        with np.errstate(over="ignore"):  # Overflow saturates to inf, giving Leq = inf
+            linear_sum = float(np.exp(arr * LN10_OVER_10).sum())
+        if linear_sum == 0:
+            return float("-inf") if np.isneginf(arr).any() else float("nan")
+        return 10.0 * math.log10(linear_sum / arr.size)
+
+    def _block_reduce(levels, firsts, lasts):
+        """
+        Return the Leq of every non-empty block of `levels`, where block i
+        spans levels[firsts[i]:lasts[i]] (NumPy fallback). The whole file
+        goes through exp() in one pass into a single buffer, rather than
+        allocating temporaries per block.
+        """
+        if firsts.size == 0:
+            return np.empty(0)
+        # One trailing pad element keeps every index valid for reduceat;
+        # the even entries of an interleaved reduceat are the block sums.
+        edges = np.column_stack([firsts, lasts]).ravel()
+        linear = np.zeros(levels.size + 1)
+        with np.errstate(over="ignore"):
+            np.multiply(levels, LN10_OVER_10, out=linear[:-1])
+            np.exp(linear[:-1], out=linear[:-1])
+        linear_sums = np.add.reduceat(linear, edges)[::2]
+        with np.errstate(divide="ignore"):
+            out = 10.0 * np.log10(linear_sums / (lasts - firsts))
+        silent = linear_sums == 0
+        if silent.any():
+            neginf = np.append(np.isneginf(levels), False)
+            has_neginf = np.logical_or.reduceat(neginf, edges)[::2]
+            out[silent & ~has_neginf] = np.nan
+        return out
 
 
 def leq(levels):
-    """Return Leq for a list of sound-pressure levels (dBA, dBC, etc.)."""
-    if not levels:
-        return float("nan")
+    """Return Leq for an array of sound-pressure levels (dBA, dBC, etc.)."""
+    return float(_leq_kernel(np.ascontiguousarray(levels, dtype=np.float64)))
+
+
+@dataclass(slots=True, frozen=True, eq=False)  # No field-wise __eq__/__hash__ over arrays
+class Blocks:
+    """
+    Leq results as parallel NumPy columns, one entry per block: int64
+    nanosecond start/end, int64 sample count, float64 Leq (unrounded) and
+    int8 unit code. Unit codes depend on which units the whole run has
+    seen, so a single file's Blocks have no unit column (None) and main
+    assigns the codes.
+    """
+    start: np.ndarray
+    end: np.ndarray
+    seconds: np.ndarray
+    leq_value: np.ndarray
+    unit: np.ndarray | None = None
+
+    def __len__(self):
+        return self.start.size
+
+    def columns(self):
+        """Return the columns that are set as a dict keyed by field name."""
+        return {field.name: getattr(self, field.name) for field in fields(self)
+                if getattr(self, field.name) is not None}
+
+    def take(self, indices):
+        """Return the blocks selected by an index array."""
+        return Blocks(**{name: column[indices] for name, column in self.columns().items()})
+
+    @classmethod
+    def concatenate(cls, parts):
+        """Join several Blocks end to end."""
+        return cls(**{name: np.concatenate([getattr(part, name) for part in parts])
+                      for name in parts[0].columns()})
+
+
+def _cache_file(path: Path, cache_dir: Path, full_blocks_only: bool):
+    """Return the cache entry for the current contents of `path`, or None if it cannot be stat'ed."""
     try:
-        linear_sum = sum(10 ** (L / 10.0) for L in levels)
-        if linear_sum == 0:
-             return float("-inf") if any(L == float("-inf") for L in levels) else float("nan")
-        mean_linear = linear_sum / len(levels)
-        return 10.0 * math.log10(mean_linear)
-    except OverflowError:
-        return float("inf")
+        st = path.stat()
+    except OSError:
+        return None
+    key = f"{CACHE_VERSION}:{path.resolve()}:{st.st_mtime_ns}:{st.st_size}:{full_blocks_only}"
+    return cache_dir / f"{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}.npz"
+
+
+def _load_cached(cache_file: Path):
+    """
+    Return (unit, blocks, messages) from the cache, where messages is the
+    stderr output of the original parse, or None on a miss or unreadable entry.
+    """
+    try:
+        with np.load(cache_file) as data:
+            blocks = Blocks(**{field.name: data[field.name] for field in fields(Blocks)
+                               if field.name in data})
+            unit = str(data["unit_name"]) or None
+            messages = str(data["messages"])
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        return None
+    return unit, blocks, messages
+
+
+def _store_cached(cache_file: Path, unit, blocks: Blocks, messages):
+    """Write blocks to the cache, atomically replacing any previous entry."""
+    tmp_name = None
+    try:
+        with tempfile.NamedTemporaryFile(dir=cache_file.parent, suffix=".tmp", delete=False) as tmp:
+            tmp_name = tmp.name
+            np.savez(tmp, **blocks.columns(), unit_name=np.array(unit or ""),
+                     messages=np.array(messages))
+        os.replace(tmp_name, cache_file)
+    except OSError as e:
+        print(f"Warning: Could not write cache file {cache_file}: {e}", file=sys.stderr)
+        if tmp_name is not None:
+            Path(tmp_name).unlink(missing_ok=True)
+
+
+def _usable_cache_dir(cache_dir: Path):
+    """Create cache_dir if needed and return it, or None (with a warning) if it cannot be written."""
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        print(f"Warning: Could not create cache directory {cache_dir}: {e}. Results will not be cached.", file=sys.stderr)
+        return None
+    if not os.access(cache_dir, os.W_OK):
+        print(f"Warning: Cache directory {cache_dir} is not writable. Results will not be cached.", file=sys.stderr)
+        return None
+    return cache_dir
 
 
-def compute_for_file(path: Path):
+def compute_for_file(path: Path, cache_dir: Path | None = None, full_blocks_only: bool = False):
     """
-    Generator that yields dictionaries of Leq results for a single file.
+    Return the Leq results for a single file as (unit, blocks), where unit
+    is the file's unit name (None without valid samples) and blocks has no
+    unit column.
+    All block Leqs for the file are computed in a single _block_reduce call.
+    If full_blocks_only is set, blocks shorter than SECONDS_PER_BLOCK are
+    dropped before their Leq is computed.
+    If cache_dir is given, results are reused from and saved to it, and the
+    warnings printed while parsing are replayed on a cache hit.
     """
-    for start, end, levels, unit_for_block in groups_of_seconds(parse_file_samples(path)):
-        yield {
-            "start": start,
-            "end": end,
-            "seconds": len(levels), # Number of 1-second samples in this block
-            "Leq_value": round(leq(levels), 2),
-            "unit": unit_for_block,
-        }
+    cache_file = _cache_file(path, cache_dir, full_blocks_only) if cache_dir is not None else None
+    if cache_file is not None:
+        cached = _load_cached(cache_file)
+        if cached is not None:
+            unit, blocks, messages = cached
+            sys.stderr.write(messages)
+            return unit, blocks
+
+    log = io.StringIO()
+    with contextlib.redirect_stderr(log):
+        ts_ns, levels, unit = parse_file_samples(path)
+    messages = log.getvalue()
+    sys.stderr.write(messages)
+    starts_ns, ends_ns, bounds = groups_of_seconds(ts_ns)
+    firsts, lasts = bounds[:-1], bounds[1:]
+    if full_blocks_only:
+        full = lasts - firsts == SECONDS_PER_BLOCK
+        starts_ns, ends_ns, firsts, lasts = starts_ns[full], ends_ns[full], firsts[full], lasts[full]
+    leq_values = _block_reduce(levels, firsts, lasts)
+    blocks = Blocks(
+        start=starts_ns,
+        end=ends_ns,
+        seconds=lasts - firsts, # Number of 1-second samples in each block
+        leq_value=leq_values, # Formatted to 2 decimals on output
+    )
+
+    if cache_file is not None:
+        _store_cached(cache_file, unit, blocks, messages)
+    return unit, blocks
+
+
+def _prefetch(path: Path):
+    """Ask the OS to start reading `path` into the page cache in the background."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
 
 
 def main():
@@ -162,49 +521,90 @@ def main():
                              "Otherwise (default), only full 15-minute periods (900 seconds) are output.")
     parser.add_argument("--csv", action="store_true",
                         help="Output comma-separated values (machine friendly).")
+    parser.add_argument("--glob", default="*", metavar="PATTERN",
+                        help="Only read files in the folder matching this pattern, e.g. '*.txt' (default: all files).")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Recompute every file instead of reusing cached results.")
+    parser.add_argument("--clear-cache", action="store_true",
+                        help=f"Delete all cached results (in {CACHE_DIR}) before running.")
     args = parser.parse_args()
 
     if not args.folder.is_dir():
         print(f"Error: Provided path '{args.folder}' is not a directory.", file=sys.stderr)
         sys.exit(1)
 
-    all_results = []
-    for file_path in args.folder.iterdir():
-        if file_path.is_file():
-            for result_item in compute_for_file(file_path):
-                all_results.append(result_item)
-    
-    if not all_results:
-        print("No results generated. Check input files and folder.", file=sys.stderr)
+    if args.clear_cache:
+        for cache_file in CACHE_DIR.glob("*.npz"):
+            cache_file.unlink(missing_ok=True)
+
+    # The cache directory is checked once here, so an unwritable one gives a
+    # single warning instead of one per file.
+    cache_dir = None if args.no_cache else _usable_cache_dir(CACHE_DIR)
+
+    # Files are independent, so they are processed in parallel, one per worker.
+    file_paths = [p for p in args.folder.glob(args.glob) if p.is_file()]
+    # Unless short periods are wanted, they are dropped before any Leq is computed.
+    compute = partial(compute_for_file, cache_dir=cache_dir,
+                      full_blocks_only=not args.include_short_periods)
+    # Read-ahead hints let the disk fetch later files while workers parse earlier
+    # ones. The hint threads only start once map() has launched the workers.
+    with ProcessPoolExecutor() as executor, ThreadPoolExecutor(max_workers=PREFETCH_THREADS) as prefetcher:
+        results = executor.map(compute, file_paths, chunksize=4)
+        if hasattr(os, "posix_fadvise"):
+            prefetcher.map(_prefetch, file_paths)
+        per_file = list(results)
+
+    # Units are carried as int8 codes and only mapped back to names on output.
+    # Codes are assigned in order of first appearance, so any unit is kept.
+    unit_names = []
+    coded = []
+    for unit, blocks in per_file:
+        if len(blocks) == 0:
+            continue
+        if unit not in unit_names:
+            unit_names.append(unit)
+        coded.append(replace(blocks, unit=np.full(len(blocks), unit_names.index(unit), dtype=np.int8)))
+
+    if not coded:
+        if args.include_short_periods:
+            print("No results generated. Check input files and folder.", file=sys.stderr)
+        else:
+            print("No full 15-minute periods found. Check input files and folder. To include shorter periods, use the --include-short-periods flag.", file=sys.stderr)
         return
 
-    all_results.sort(key=lambda x: x["start"])
-
-    # Filter results based on --include-short-periods argument
-    if args.include_short_periods:
+    # Each file's blocks are already in time order, so ordering the files by
+    # their first block normally leaves the concatenation sorted. Overlapping
+    # files fall back to a stable sort, which merges the presorted runs.
+    all_results = Blocks.concatenate(sorted(coded, key=lambda blocks: blocks.start[0]))
+    starts = all_results.start
+    if np.all(starts[1:] >= starts[:-1]):
         results_to_print = all_results
-    else: # Default behavior: only include full 15-minute periods
-        results_to_print = [res for res in all_results if res["seconds"] == SECONDS_PER_BLOCK]
-    
-    if not results_to_print and not args.include_short_periods and all_results:
-        print("Note: No full 15-minute periods found. To include shorter periods, use the --include-short-periods flag.", file=sys.stderr)
-    elif not results_to_print and not all_results: # Handles if all_results was empty to begin with
-        pass # Message already printed above
-    
-    is_first_csv_line = True
-    for row in results_to_print:
-        if args.csv:
-            if is_first_csv_line:
-                # print(",".join(FIELDNAMES)) # Uncomment if you want a header in CSV output
-                is_first_csv_line = False
-            print(",".join(str(row[k]) for k in FIELDNAMES))
-        else:
-            s = row["start"].strftime("%Y-%m-%d %H:%M:%S")
-            e = row["end"].strftime("%Y-%m-%d %H:%M:%S")
-            dur = row["seconds"]
-            val = row["Leq_value"]
-            unit = row["unit"]
-            print(f"{s} – {e}  ({dur:>4} s)  Leq = {val:>6.2f} {unit}")
+    else:
+        results_to_print = all_results.take(np.argsort(starts, kind="stable"))
+
+    leq_values = results_to_print.leq_value.tolist()
+    rows = zip(_ns_to_datetimes(results_to_print.start),
+               _ns_to_datetimes(results_to_print.end),
+               results_to_print.seconds.tolist(),
+               [f"{val:.2f}" for val in leq_values] if args.csv else leq_values,
+               [unit_names[code] for code in results_to_print.unit.tolist()])
+    if args.csv:
+        writer = csv_parser.writer(sys.stdout, lineterminator="\n")
+        # writer.writerow(FIELDNAMES) # Uncomment if you want a header in CSV output
+        writer.writerows(rows)
+        return
+
+    # Output is collected and written in chunks rather than one print() per row.
+    lines = []
+    for start, end, dur, val, unit in rows:
+        s = start.strftime("%Y-%m-%d %H:%M:%S")
+        e = end.strftime("%Y-%m-%d %H:%M:%S")
+        lines.append(f"{s} – {e}  ({dur:>4} s)  Leq = {val:>6.2f} {unit}")
+        if len(lines) == OUTPUT_CHUNK_LINES:
+            sys.stdout.write("\n".join(lines) + "\n")
+            lines.clear()
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,99 @@
+"""
+Checks for noise_leq_directory's vectorized timestamp parsing against
+datetime.strptime. Run with: python -m unittest test_noise_leq_directory
+"""
+
+import unittest
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from noise_leq_directory import _timestamps_ns
+
+EPOCH = datetime(1970, 1, 1)
+# The int64 nanosecond range, as naive datetimes (truncated to microseconds)
+NS_MIN = datetime(1677, 9, 21, 0, 12, 44)
+NS_MAX = datetime(2262, 4, 11, 23, 47, 16)
+
+ROWS = [
+    # Valid rows
+    ("25-05-2025", "20:20:34"),
+    ("31-05-2025", "15:45:49"),
+    ("01-01-1970", "00:00:00"),
+    ("29-02-2024", "23:59:59"),
+    ("31-12-2025", "12:00:00"),
+    # Impossible dates and times
+    ("31-02-2025", "10:00:00"),
+    ("29-02-2025", "10:00:00"),
+    ("31-04-2025", "10:00:00"),
+    ("01-13-2025", "10:00:00"),
+    ("00-06-2025", "10:00:00"),
+    ("01-06-2025", "24:00:00"),
+    ("01-06-2025", "10:60:00"),
+    ("01-06-2025", "10:00:60"),
+    # Single digits
+    ("1-06-2025", "10:00:00"),
+    ("01-6-2025", "10:00:00"),
+    ("01-06-2025", "9:00:00"),
+    # Trailing spaces
+    ("01-06-2025 ", "10:00:00"),
+    ("01-06-2025", "10:00:00  "),
+    # Non-ASCII text
+    ("01–06-2025", "10:00:00"),
+    ("01-06-2025", "10:00:0é"),
+    ("é", "10:00:00"),
+    # Other malformed fields
+    ("", "10:00:00"),
+    ("01/06/2025", "10:00:00"),
+    ("01-06-25", "10:00:00"),
+    ("01-06-2025", "10-00-00"),
+    ("01-06-2025x", "10:00:00"),
+    # Out-of-range years, on the fast and slow path
+    ("01-06-2999", "00:00:00"),
+    ("01-06-2999 ", "00:00:00"),
+    ("01-06-1500", "00:00:00"),
+    ("01-06-0000", "00:00:00"),
+    ("21-09-1677", "00:00:00"),
+    ("22-09-1677", "00:00:00"),
+    ("11-04-2262", "23:47:16"),
+    ("11-04-2262", "23:47:17"),
+    ("12-04-2262", "00:00:00"),
+]
+
+
+def expected_ns(date, time):
+    """Reference result for one row: nanoseconds since the epoch, or None if invalid."""
+    try:
+        dt = datetime.strptime(f"{date.strip()},{time.strip()}", "%d-%m-%Y,%H:%M:%S")
+    except ValueError:
+        return None
+    if not NS_MIN <= dt <= NS_MAX:
+        return None
+    return (dt - EPOCH) // timedelta(microseconds=1) * 1000
+
+
+class TimestampsTest(unittest.TestCase):
+    def check(self, rows):
+        dates, times = zip(*rows)
+        ts_ns, bad = _timestamps_ns(pd.Series(dates, dtype=str), pd.Series(times, dtype=str))
+        for (date, time), ns, is_bad in zip(rows, ts_ns.tolist(), bad.tolist()):
+            with self.subTest(date=date, time=time):
+                want = expected_ns(date, time)
+                self.assertEqual(is_bad, want is None)
+                if want is not None:
+                    self.assertEqual(ns, want)
+
+    def test_matches_strptime(self):
+        self.check(ROWS)
+
+    def test_each_row_alone(self):
+        # Rows are classified on their own, whatever else is in the file
+        for row in ROWS:
+            self.check([row])
+
+    def test_ascii_rows_only(self):
+        self.check([row for row in ROWS if row[0].isascii() and row[1].isascii()])
+
+
+if __name__ == "__main__":
+    unittest.main()